@@ -1,7 +1,9 @@
+import threading
 import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from types import MappingProxyType
 import modules.data_fetcher as data_fetcher
 import modules.visualizations as visualizations
 import modules.predictions as predictions
@@ -14,6 +16,157 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+DEFAULT_SYMBOL = "AAPL"
+
+# Sidebar options - built once at import rather than on every rerun
+TIMEFRAME_OPTIONS = MappingProxyType({
+    "1 Day": "1d",
+    "5 Days": "5d",
+    "1 Month": "1mo",
+    "3 Months": "3mo", 
+    "6 Months": "6mo",
+    "1 Year": "1y",
+    "2 Years": "2y",
+    "5 Years": "5y",
+    "10 Years": "10y",
+    "Year to Date": "ytd",
+    "Max": "max"
+})
+
+TIMEFRAME_LABELS = tuple(TIMEFRAME_OPTIONS)
+
+# Interval used for each timeframe
+INTERVAL_OPTIONS = MappingProxyType({
+    "1 Day": "5m",
+    "5 Days": "15m",
+    "1 Month": "1h",
+    "3 Months": "1d",
+    "6 Months": "1d",
+    "1 Year": "1d",
+    "2 Years": "1d",
+    "5 Years": "1wk",
+    "10 Years": "1mo",
+    "Year to Date": "1d",
+    "Max": "1mo"
+})
+
+# Cached data fetchers - Streamlit reruns the whole script on every widget
+# interaction, so keep Yahoo Finance responses in memory between reruns.
+# data_fetcher returns None/{} on failure; raising instead keeps those out of
+# the cache (st.cache_data doesn't store exceptions) so the next rerun retries
+@st.cache_data(ttl=300, show_spinner=False)
+def _hist(symbol, period, interval):
+    data = data_fetcher.get_historical_data(symbol, period, interval)
+    if data is None or data.empty:
+        raise ValueError(f"No historical data for {symbol}")
+    return data
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _info(symbol):
+    info = data_fetcher.get_company_info(symbol)
+    if not info:
+        raise ValueError(f"No company info for {symbol}")
+    return info
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fin(symbol):
+    financial_data = data_fetcher.get_financial_data(symbol)
+    if financial_data is None or financial_data.empty:
+        raise ValueError(f"No financial data for {symbol}")
+    # Arrow-backed dtypes let st.dataframe hand the frame over without converting it
+    return financial_data.convert_dtypes(dtype_backend='pyarrow')
+
+def _human(x, prefix='$'):
+    """Format a large number with a T/B/M suffix chosen by its magnitude"""
+    a = abs(x)
+    return (f"{prefix}{x / 1e12:.2f}T" if a >= 1e12
+            else f"{prefix}{x / 1e9:.2f}B" if a >= 1e9
+            else f"{prefix}{x / 1e6:.2f}M" if a >= 1e6
+            else f"{prefix}{x:,.2f}" if prefix
+            else f"{x:,.0f}")
+
+def _float32_prices(df):
+    """Copy of the data with float32 prices for the chart builders"""
+    price_columns = [c for c in ['Open', 'High', 'Low', 'Close', 'Adj Close'] if c in df.columns]
+    return df.astype({c: 'float32' for c in price_columns})
+
+# Valuation ratios: fmt key -> (company_info key, scale, prefix, suffix).
+# Dividend yield is reported as a fraction
+RATIO_FORMATS = {
+    'pe': ('trailingPE', 1, '', ''),
+    'eps': ('trailingEps', 1, '$', ''),
+    'fpe': ('forwardPE', 1, '', ''),
+    'div': ('dividendYield', 100, '', '%'),
+    'beta': ('beta', 1, '', ''),
+}
+
+def _ratio(info, key, scale=1, prefix='', suffix=''):
+    """Format a company ratio, showing N/A when Yahoo reports the key as None"""
+    value = info.get(key, 0)
+    if value is None:
+        return 'N/A'
+    return f"{prefix}{value * scale:.2f}{suffix}"
+
+def _signature(df):
+    """Cheap cache key for a historical data frame"""
+    # The timestamp column is 'Date' for daily data but 'Datetime' for intraday
+    # intervals, so read it by position
+    return (
+        len(df), df.iloc[-1, 0],
+        float(df['Close'].iat[0]), float(df['Close'].iat[-1]), float(df['Volume'].iat[-1])
+    )
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _indicators(sig, symbol, period, _df):
+    return visualizations.add_technical_indicators(_float32_prices(_df))
+
+# Cached chart builders - long price series are merged into fewer OHLC bars
+# before plotting, and the frame itself is passed as an underscore argument so
+# Streamlit skips hashing it and keys the cache on the signature instead.
+# Figures are never modified after being built, so cache_resource hands back
+# the object itself rather than paying for Plotly's validation again on
+# unpickle. Entries expire with the underlying data and are capped so new bars
+# and symbols don't grow memory
+@st.cache_resource(ttl=300, max_entries=32, show_spinner=False)
+def _price_chart(sig, symbol, period, _df):
+    return visualizations.create_price_chart(visualizations.downsample_ohlc(_df), symbol, period)
+
+@st.cache_resource(ttl=300, max_entries=32, show_spinner=False)
+def _volume_chart(sig, symbol, _df):
+    return visualizations.create_volume_chart(_df, symbol)
+
+@st.cache_resource(ttl=300, max_entries=32, show_spinner=False)
+def _indicators_chart(sig, symbol, _df):
+    return visualizations.create_technical_indicators(_df, symbol)
+
+@st.cache_resource(ttl=300, max_entries=32, show_spinner=False)
+def _prediction_chart(sig, symbol, prediction_data, _df):
+    return visualizations.create_prediction_chart(_float32_prices(_df), prediction_data, symbol)
+
+# Model training is the most expensive step, so trained results are shared
+# across reruns and sessions for identical data
+@st.cache_resource(ttl=300, max_entries=32, show_spinner=False)
+def _predict(sig, symbol, period, _df):
+    return predictions.predict_next_day(_df, symbol)
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _to_csv(sig, symbol, period, _df):
+    return _df.to_csv(index=True).encode()
+
+def _prewarm(symbol):
+    # Failures aren't cached, so the main script simply fetches again
+    for fetch in (_info, _fin):
+        try:
+            fetch(symbol)
+        except ValueError:
+            pass
+
+# On a session's first run, fetch the default symbol's company info and
+# financials in the background while the main script fetches its history
+if st.runtime.exists() and 'prewarmed' not in st.session_state:
+    st.session_state['prewarmed'] = True
+    threading.Thread(target=_prewarm, args=(DEFAULT_SYMBOL,), daemon=True).start()
+
 # App title and description
 st.title("📈 Stock Analysis")
 st.markdown("Analyze real-time stock data with interactive charts and predictive capabilities by Vishwanath tanmai")
@@ -23,47 +176,19 @@ with st.sidebar:
     st.header("Settings")
     
     # Stock search box
-    stock_symbol = st.text_input("Enter Stock Symbol (e.g., AAPL, MSFT, GOOGL)", value="AAPL").upper()
+    stock_symbol = st.text_input("Enter Stock Symbol (e.g., AAPL, MSFT, GOOGL)", value=DEFAULT_SYMBOL).upper()
     
     # Timeframe selection
-    timeframe_options = {
-        "1 Day": "1d",
-        "5 Days": "5d",
-        "1 Month": "1mo",
-        "3 Months": "3mo", 
-        "6 Months": "6mo",
-        "1 Year": "1y",
-        "2 Years": "2y",
-        "5 Years": "5y",
-        "10 Years": "10y",
-        "Year to Date": "ytd",
-        "Max": "max"
-    }
-    
     selected_timeframe = st.selectbox(
         "Select Timeframe",
-        list(timeframe_options.keys()),
+        TIMEFRAME_LABELS,
         index=4
     )
     
-    timeframe = timeframe_options[selected_timeframe]
+    timeframe = TIMEFRAME_OPTIONS[selected_timeframe]
     
     # Interval selection based on timeframe
-    interval_options = {
-        "1 Day": "5m",
-        "5 Days": "15m",
-        "1 Month": "1h",
-        "3 Months": "1d",
-        "6 Months": "1d",
-        "1 Year": "1d",
-        "2 Years": "1d",
-        "5 Years": "1wk",
-        "10 Years": "1mo",
-        "Year to Date": "1d",
-        "Max": "1mo"
-    }
-    
-    interval = interval_options[selected_timeframe]
+    interval = INTERVAL_OPTIONS[selected_timeframe]
     
 
 
@@ -72,206 +197,234 @@ try:
     # Loading spinner while fetching data
     with st.spinner(f"Fetching data for {stock_symbol}..."):
         # Fetch historical data
-        hist_data = data_fetcher.get_historical_data(stock_symbol, timeframe, interval)
+        try:
+            hist_data = _hist(stock_symbol, timeframe, interval)
+        except ValueError:
+            hist_data = None
         
         # Fetch company info - with fallback for invalid symbols
-        if hist_data is None or hist_data.empty:
+        if hist_data is None:
             st.error(f"No data available for {stock_symbol}. Please check the symbol and try again.")
             st.info("Please try a different stock symbol or timeframe.")
             st.stop()  # Stop execution if no data
+        
+        # Latest close from the data we already have - saves a second round-trip
+        # and is reused by the overview and prediction tabs
+        last_close = float(hist_data['Close'].values[-1])
             
-        company_info = data_fetcher.get_company_info(stock_symbol)
+        try:
+            company_info = _info(stock_symbol)
+        except ValueError:
+            company_info = {}
+        
+        data_sig = _signature(hist_data)
+        
+        # Indicators are computed once and shared by the price and technical charts
+        indicator_data = _indicators(data_sig, stock_symbol, timeframe, hist_data)
+        
+        # Format the company metrics once - several appear in more than one tab
+        ci = company_info
+        
+        fmt = {
+            'price': f"${last_close:.2f}",
+            'chg': f"{ci.get('regularMarketChangePercent', 0):.2f}%",
+            'prev': f"${ci.get('regularMarketPreviousClose', 0):.2f}",
+            'range': f"${ci.get('regularMarketDayLow', 0):.2f} - ${ci.get('regularMarketDayHigh', 0):.2f}",
+            '52w_low': f"${ci.get('fiftyTwoWeekLow', 0):.2f}",
+            '52w_high': f"${ci.get('fiftyTwoWeekHigh', 0):.2f}",
+            'mcap': _human(ci.get('marketCap', 0)),
+            'avg_vol': _human(ci.get('averageVolume', 0), prefix=''),
+        }
+        fmt.update({name: _ratio(ci, *spec) for name, spec in RATIO_FORMATS.items()})
         
-        # If we have data, display it
-        if hist_data is not None and not hist_data.empty:
-            # Display company name and basic info
-            st.header(f"{company_info.get('shortName', stock_symbol)}")
-            st.subheader(f"{company_info.get('exchange', '')} : {stock_symbol}")
+        # Display company name and basic info
+        st.header(f"{company_info.get('shortName', stock_symbol)}")
+        st.subheader(f"{company_info.get('exchange', '')} : {stock_symbol}")
+        
+        # Create tabs for different sections
+        tab1, tab2, tab3, tab4 = st.tabs(["Overview", "Financial Data", "Prediction", "About"])
+        
+        with tab1:
+            # Top metrics - rendered as a single table rather than one element per metric
+            overview_metrics = pd.DataFrame({
+                'Metric': ["Current Price", "Change", "Previous Close", "Day Range", "52 Week Range"],
+                'Value': [
+                    fmt['price'],
+                    fmt['chg'],
+                    fmt['prev'],
+                    fmt['range'],
+                    f"{fmt['52w_low']} - {fmt['52w_high']}",
+                ]
+            })
+            st.dataframe(overview_metrics, hide_index=True, use_container_width=True)
             
-            # Create tabs for different sections
-            tab1, tab2, tab3, tab4 = st.tabs(["Overview", "Financial Data", "Prediction", "About"])
+            # Stock price chart
+            st.subheader(f"{stock_symbol} Stock Price Chart")
+            price_chart = _price_chart(data_sig, stock_symbol, timeframe, indicator_data)
+            st.plotly_chart(price_chart, use_container_width=True)
             
-            with tab1:
-                # Top metrics row
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    current_price = data_fetcher.get_current_price(stock_symbol)
-                    st.metric(
-                        "Current Price", 
-                        f"${current_price:.2f}", 
-                        f"{company_info.get('regularMarketChangePercent', 0):.2f}%"
-                    )
-                
-                with col2:
-                    st.metric(
-                        "Previous Close", 
-                        f"${company_info.get('regularMarketPreviousClose', 0):.2f}"
-                    )
-                
-                with col3:
-                    st.metric(
-                        "Day Range", 
-                        f"${company_info.get('regularMarketDayLow', 0):.2f} - ${company_info.get('regularMarketDayHigh', 0):.2f}"
-                    )
-                
-                with col4:
-                    st.metric(
-                        "52 Week Range", 
-                        f"${company_info.get('fiftyTwoWeekLow', 0):.2f} - ${company_info.get('fiftyTwoWeekHigh', 0):.2f}"
-                    )
-                
-                # Stock price chart
-                st.subheader(f"{stock_symbol} Stock Price Chart")
-                price_chart = visualizations.create_price_chart(hist_data, stock_symbol, timeframe)
-                st.plotly_chart(price_chart, use_container_width=True)
-                
-                # Volume Chart
-                st.subheader("Trading Volume")
-                volume_chart = visualizations.create_volume_chart(hist_data, stock_symbol)
-                st.plotly_chart(volume_chart, use_container_width=True)
-                
-                # Download data button
-                csv = hist_data.to_csv(index=True)
-                st.download_button(
-                    label="Download Data as CSV",
-                    data=csv,
-                    file_name=f"{stock_symbol}_{timeframe}_data.csv",
-                    mime="text/csv",
-                )
+            # Volume Chart
+            st.subheader("Trading Volume")
+            volume_chart = _volume_chart(data_sig, stock_symbol, hist_data)
+            st.plotly_chart(volume_chart, use_container_width=True)
             
-            with tab2:
-                # Financial Data Section
-                st.header("Key Financial Metrics")
-                
-                # Key Metrics
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Market Cap", f"${company_info.get('marketCap', 0) / 1_000_000_000:.2f}B")
-                    st.metric("P/E Ratio", f"{company_info.get('trailingPE', 0):.2f}")
-                    st.metric("EPS (TTM)", f"${company_info.get('trailingEps', 0):.2f}")
-                
-                with col2:
-                    st.metric("Forward P/E", f"{company_info.get('forwardPE', 0):.2f}")
-                    st.metric("Dividend Yield", f"{company_info.get('dividendYield', 0) * 100:.2f}%")
-                    st.metric("Beta", f"{company_info.get('beta', 0):.2f}")
-                
-                with col3:
-                    st.metric("52W High", f"${company_info.get('fiftyTwoWeekHigh', 0):.2f}")
-                    st.metric("52W Low", f"${company_info.get('fiftyTwoWeekLow', 0):.2f}")
-                    st.metric("Avg Volume", f"{company_info.get('averageVolume', 0) / 1_000_000:.2f}M")
-                
-                # Financial ratios
-                st.subheader("Financial Ratios")
-                
+            # Download data button
+            csv = _to_csv(data_sig, stock_symbol, timeframe, hist_data)
+            st.download_button(
+                label="Download Data as CSV",
+                data=csv,
+                file_name=f"{stock_symbol}_{timeframe}_data.csv",
+                mime="text/csv",
+            )
+        
+        with tab2:
+            # Financial Data Section
+            st.header("Key Financial Metrics")
+            
+            # Key Metrics
+            key_metrics = pd.DataFrame({
+                'Metric': [
+                    "Market Cap", "P/E Ratio", "EPS (TTM)",
+                    "Forward P/E", "Dividend Yield", "Beta",
+                    "52W High", "52W Low", "Avg Volume"
+                ],
+                'Value': [
+                    fmt['mcap'],
+                    fmt['pe'],
+                    fmt['eps'],
+                    fmt['fpe'],
+                    fmt['div'],
+                    fmt['beta'],
+                    fmt['52w_high'],
+                    fmt['52w_low'],
+                    fmt['avg_vol'],
+                ]
+            })
+            st.dataframe(key_metrics, hide_index=True, use_container_width=True)
+            
+            # Financial ratios
+            st.subheader("Financial Ratios")
+            
+            try:
+                # Get financial data
                 try:
-                    # Get financial data
-                    financial_data = data_fetcher.get_financial_data(stock_symbol)
-                    
-                    if financial_data is not None and not financial_data.empty:
-                        st.dataframe(financial_data, use_container_width=True)
-                    else:
-                        st.warning("Financial data not available for this stock")
-                except Exception as e:
-                    st.error(f"Error retrieving financial data: {e}")
+                    financial_data = _fin(stock_symbol)
+                except ValueError:
+                    financial_data = None
                 
-                # Technical Indicators
-                st.subheader("Technical Indicators")
-                
-                indicators_chart = visualizations.create_technical_indicators(hist_data, stock_symbol)
-                st.plotly_chart(indicators_chart, use_container_width=True)
+                if financial_data is not None:
+                    st.dataframe(financial_data, use_container_width=True)
+                else:
+                    st.warning("Financial data not available for this stock")
+            except Exception as e:
+                st.error(f"Error retrieving financial data: {e}")
             
-            with tab3:
-                st.header("Stock Price Prediction")
-                st.info("This prediction model uses historical stock data to forecast potential future price movements. Please note that these predictions are for educational purposes only and should not be used as financial advice.")
-                
-                # Training the prediction model
+            # Technical Indicators
+            st.subheader("Technical Indicators")
+            
+            indicators_chart = _indicators_chart(data_sig, stock_symbol, indicator_data)
+            st.plotly_chart(indicators_chart, use_container_width=True)
+        
+        with tab3:
+            st.header("Stock Price Prediction")
+            st.info("This prediction model uses historical stock data to forecast potential future price movements. Please note that these predictions are for educational purposes only and should not be used as financial advice.")
+            
+            # Train the model only on request - st.tabs runs every tab body on each rerun
+            prediction_key = (stock_symbol, timeframe, data_sig)
+            if st.button("Generate Prediction", key="pred_btn"):
                 with st.spinner("Training prediction model..."):
-                    prediction_data = predictions.predict_next_day(hist_data, stock_symbol)
-                
-                if prediction_data is not None:
-                    # Display predictions
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        # Predicted price for next day
-                        predicted_price = prediction_data['predicted_price']
-                        current_price = hist_data['Close'].iloc[-1]
-                        price_diff = predicted_price - current_price
-                        price_change_pct = (price_diff / current_price) * 100
-                        
-                        # Color coding based on prediction direction
-                        if predicted_price > current_price:
-                            st.markdown(f"<h3 style='color: #2E7D32'>Predicted Next Day Price: ${predicted_price:.2f}</h3>", unsafe_allow_html=True)
-                            st.markdown(f"<h4 style='color: #2E7D32'>Change: +${price_diff:.2f} (+{price_change_pct:.2f}%)</h4>", unsafe_allow_html=True)
-                        else:
-                            st.markdown(f"<h3 style='color: #C62828'>Predicted Next Day Price: ${predicted_price:.2f}</h3>", unsafe_allow_html=True)
-                            st.markdown(f"<h4 style='color: #C62828'>Change: ${price_diff:.2f} ({price_change_pct:.2f}%)</h4>", unsafe_allow_html=True)
-                        
-                        # Model metrics
-                        st.subheader("Model Performance Metrics")
-                        st.metric("Mean Absolute Error", f"${prediction_data['mae']:.4f}")
-                        st.metric("Root Mean Squared Error", f"${prediction_data['rmse']:.4f}")
-                        st.metric("R-squared", f"{prediction_data['r2']:.4f}")
-                    
-                    with col2:
-                        # Show prediction chart
-                        prediction_chart = visualizations.create_prediction_chart(
-                            hist_data, prediction_data, stock_symbol
-                        )
-                        st.plotly_chart(prediction_chart, use_container_width=True)
-                    
-                    st.caption("⚠️ Disclaimer: This is a simplified prediction model for educational purposes. Stock market predictions are inherently uncertain.")
-                else:
-                    st.error("Unable to generate predictions. Insufficient data or error in the prediction model.")
+                    st.session_state['pred'] = {
+                        'key': prediction_key,
+                        'data': _predict(data_sig, stock_symbol, timeframe, hist_data)
+                    }
             
-            with tab4:
-                # About the company section
-                st.header("About the Company")
-                
-                # Company profile
-                if 'longBusinessSummary' in company_info:
-                    st.markdown(company_info['longBusinessSummary'])
-                else:
-                    st.warning("No company description available")
+            # Results are kept in session state until the symbol, timeframe or data changes
+            saved_prediction = st.session_state.get('pred')
+            
+            if saved_prediction is None or saved_prediction['key'] != prediction_key:
+                st.caption("Click \"Generate Prediction\" to train the model on the latest data for the selected stock and timeframe.")
+            elif saved_prediction['data'] is not None:
+                prediction_data = saved_prediction['data']
                 
-                # Key company data
+                # Display predictions
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    st.subheader("Company Information")
-                    company_data = {
-                        "Sector": company_info.get('sector', 'N/A'),
-                        "Industry": company_info.get('industry', 'N/A'),
-                        "Full Time Employees": company_info.get('fullTimeEmployees', 'N/A'),
-                        "Country": company_info.get('country', 'N/A'),
-                        "Website": company_info.get('website', 'N/A'),
-                    }
+                    # Predicted price for next day
+                    predicted_price = prediction_data['predicted_price']
+                    price_diff = predicted_price - last_close
+                    price_change_pct = (price_diff / last_close) * 100
+                    
+                    # Color coding based on prediction direction
+                    is_up = predicted_price > last_close
+                    color = '#2E7D32' if is_up else '#C62828'
+                    sign = '+' if is_up else ''
+                    st.markdown(
+                        f"<h3 style='color: {color}'>Predicted Next Day Price: ${predicted_price:.2f}</h3>"
+                        f"<h4 style='color: {color}'>Change: {sign}${price_diff:.2f} ({sign}{price_change_pct:.2f}%)</h4>",
+                        unsafe_allow_html=True
+                    )
                     
-                    for key, value in company_data.items():
-                        st.markdown(f"**{key}:** {value}")
+                    # Model metrics
+                    st.subheader("Model Performance Metrics")
+                    st.metric("Mean Absolute Error", f"${prediction_data['mae']:.4f}")
+                    st.metric("Root Mean Squared Error", f"${prediction_data['rmse']:.4f}")
+                    st.metric("R-squared", f"{prediction_data['r2']:.4f}")
                 
                 with col2:
-                    st.subheader("Key Executives")
-                    try:
-                        if 'companyOfficers' in company_info and company_info['companyOfficers']:
-                            executives_data = []
-                            for officer in company_info['companyOfficers'][:5]:  # Limit to top 5
-                                executive = {
-                                    "Name": officer.get('name', 'N/A'),
-                                    "Title": officer.get('title', 'N/A'),
-                                    "Pay": f"${officer.get('totalPay', 0)/1000000:.2f}M" if 'totalPay' in officer else 'N/A'
-                                }
-                                executives_data.append(executive)
-                            
-                            df_executives = pd.DataFrame(executives_data)
-                            st.dataframe(df_executives, use_container_width=True)
-                        else:
-                            st.info("No executive data available")
-                    except Exception as e:
-                        st.error(f"Error displaying executive data: {str(e)}")
-        else:
-            st.error(f"No data available for {stock_symbol}. Please check the symbol and try again.")
+                    # Show prediction chart
+                    prediction_chart = _prediction_chart(
+                        data_sig, stock_symbol, prediction_data, hist_data
+                    )
+                    st.plotly_chart(prediction_chart, use_container_width=True)
+                
+                st.caption("⚠️ Disclaimer: This is a simplified prediction model for educational purposes. Stock market predictions are inherently uncertain.")
+            else:
+                st.error("Unable to generate predictions. Insufficient data or error in the prediction model.")
+        
+        with tab4:
+            # About the company section
+            st.header("About the Company")
+            
+            # Company profile
+            if 'longBusinessSummary' in company_info:
+                st.markdown(company_info['longBusinessSummary'])
+            else:
+                st.warning("No company description available")
+            
+            # Key company data
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Company Information")
+                company_data = {
+                    "Sector": company_info.get('sector', 'N/A'),
+                    "Industry": company_info.get('industry', 'N/A'),
+                    "Full Time Employees": company_info.get('fullTimeEmployees', 'N/A'),
+                    "Country": company_info.get('country', 'N/A'),
+                    "Website": company_info.get('website', 'N/A'),
+                }
+                
+                st.markdown("\n\n".join(f"**{key}:** {value}" for key, value in company_data.items()))
+            
+            with col2:
+                st.subheader("Key Executives")
+                try:
+                    if 'companyOfficers' in company_info and company_info['companyOfficers']:
+                        officers = pd.DataFrame(company_info['companyOfficers'][:5])  # Limit to top 5
+                        officers = officers.reindex(columns=['name', 'title', 'totalPay'])
+                        
+                        # Format pay column-wise, keeping N/A for officers without pay data
+                        pay = officers['totalPay']
+                        officers['Pay'] = ('$' + (pay / 1_000_000).map('{:.2f}'.format) + 'M').where(pay.notna(), 'N/A')
+                        
+                        df_executives = officers.rename(columns={'name': 'Name', 'title': 'Title'}).fillna({'Name': 'N/A', 'Title': 'N/A'})
+                        df_executives = df_executives[['Name', 'Title', 'Pay']].convert_dtypes(dtype_backend='pyarrow')
+                        st.dataframe(df_executives, hide_index=True, use_container_width=True)
+                    else:
+                        st.info("No executive data available")
+                except Exception as e:
+                    st.error(f"Error displaying executive data: {str(e)}")
 
 except Exception as e:
     st.error(f"An error occurred: {str(e)}")
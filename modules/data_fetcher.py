@@ -53,26 +53,6 @@ def get_company_info(ticker):
         print(f"Error fetching company info for {ticker}: {e}")
         return {}
 
-def get_current_price(ticker):
-    """
-    Get the current price of a stock
-    
-    Parameters:
-    ticker (str): Stock symbol
-    
-    Returns:
-    float: Current stock price
-    """
-    try:
-        stock = yf.Ticker(ticker)
-        data = stock.history(period="1d")
-        if not data.empty:
-            return data['Close'].iloc[-1]
-        return 0
-    except Exception as e:
-        print(f"Error fetching current price for {ticker}: {e}")
-        return 0
-
 def get_financial_data(ticker):
     """
     Get key financial data for a stock
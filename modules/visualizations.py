@@ -4,18 +4,89 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta, date
 
+def downsample_ohlc(data, n_out=2000):
+    """
+    Downsample data for a candlestick chart by merging consecutive rows into bars
+    
+    Parameters:
+    data (pandas.DataFrame): Historical stock data, optionally with indicator columns
+    n_out (int): Maximum number of bars to keep
+    
+    Returns:
+    pandas.DataFrame: One row per bucket with first Open, max High, min Low and last Close
+    """
+    n = len(data)
+    if n <= n_out:
+        return data
+    
+    # Split the rows into n_out consecutive buckets of near-equal size
+    buckets = np.arange(n) * n_out // n
+    
+    # Each bar starts at its first timestamp and ends on its last value; volume adds up
+    agg = {column: 'last' for column in data.columns}
+    agg[data.columns[0]] = 'first'
+    agg.update({c: how for c, how in [('Open', 'first'), ('High', 'max'), ('Low', 'min'), ('Volume', 'sum')]
+                if c in data.columns})
+    
+    return data.groupby(buckets).agg(agg)
+
+def add_technical_indicators(data):
+    """
+    Add moving averages, Bollinger Bands, MACD and RSI columns to the data
+    
+    Parameters:
+    data (pandas.DataFrame): Historical stock data
+    
+    Returns:
+    pandas.DataFrame: Copy of the data with indicator columns added
+    """
+    # Create a copy of the data to avoid modifying the original
+    df = data.copy()
+    close = df['Close']
+    
+    # Simple moving averages and Bollinger Bands
+    df['SMA20'] = close.rolling(window=20).mean()
+    df['SMA50'] = close.rolling(window=50).mean()
+    df['STD20'] = close.rolling(window=20).std()
+    df['Upper_Band'] = df['SMA20'] + (df['STD20'] * 2)
+    df['Lower_Band'] = df['SMA20'] - (df['STD20'] * 2)
+    
+    # Calculate MACD (Moving Average Convergence Divergence)
+    df['EMA12'] = close.ewm(span=12, adjust=False).mean()
+    df['EMA26'] = close.ewm(span=26, adjust=False).mean()
+    df['MACD'] = df['EMA12'] - df['EMA26']
+    df['Signal_Line'] = df['MACD'].ewm(span=9, adjust=False).mean()
+    df['MACD_Histogram'] = df['MACD'] - df['Signal_Line']
+    
+    # Calculate RSI (Relative Strength Index)
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    
+    avg_gain = gain.rolling(window=14).mean()
+    avg_loss = loss.rolling(window=14).mean()
+    
+    rs = avg_gain / avg_loss
+    df['RSI'] = 100 - (100 / (1 + rs))
+    
+    return df
+
 def create_price_chart(data, ticker, period):
     """
     Create an interactive stock price chart
     
     Parameters:
-    data (pandas.DataFrame): Historical stock data
+    data (pandas.DataFrame): Historical stock data, optionally with indicator columns
     ticker (str): Stock symbol
     period (str): Time period
     
     Returns:
     plotly.graph_objects.Figure: Interactive stock price chart
     """
+    # Reuse precomputed moving averages when available
+    if 'SMA20' not in data.columns:
+        data = add_technical_indicators(data)
+    
     # Create figure
     fig = go.Figure()
     
@@ -34,26 +105,24 @@ def create_price_chart(data, ticker, period):
     )
     
     # Add moving averages
-    if len(data) >= 20:
+    if data['SMA20'].notna().any():
         # 20-day moving average
-        data['MA20'] = data['Close'].rolling(window=20).mean()
         fig.add_trace(
             go.Scatter(
                 x=data['Date'],
-                y=data['MA20'],
+                y=data['SMA20'],
                 mode='lines',
                 line=dict(color='#0D47A1', width=1),
                 name='20-day MA'
             )
         )
     
-    if len(data) >= 50:
+    if data['SMA50'].notna().any():
         # 50-day moving average
-        data['MA50'] = data['Close'].rolling(window=50).mean()
         fig.add_trace(
             go.Scatter(
                 x=data['Date'],
-                y=data['MA50'],
+                y=data['SMA50'],
                 mode='lines',
                 line=dict(color='#FB8C00', width=1),
                 name='50-day MA'
@@ -132,38 +201,14 @@ def create_technical_indicators(data, ticker):
     Create a chart with technical indicators
     
     Parameters:
-    data (pandas.DataFrame): Historical stock data
+    data (pandas.DataFrame): Historical stock data, optionally with indicator columns
     ticker (str): Stock symbol
     
     Returns:
     plotly.graph_objects.Figure: Chart with technical indicators
     """
-    # Create a copy of the data to avoid modifying the original
-    df = data.copy()
-    
-    # Calculate RSI (Relative Strength Index)
-    delta = df['Close'].diff()
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
-    
-    avg_gain = gain.rolling(window=14).mean()
-    avg_loss = loss.rolling(window=14).mean()
-    
-    rs = avg_gain / avg_loss
-    df['RSI'] = 100 - (100 / (1 + rs))
-    
-    # Calculate MACD (Moving Average Convergence Divergence)
-    df['EMA12'] = df['Close'].ewm(span=12, adjust=False).mean()
-    df['EMA26'] = df['Close'].ewm(span=26, adjust=False).mean()
-    df['MACD'] = df['EMA12'] - df['EMA26']
-    df['Signal_Line'] = df['MACD'].ewm(span=9, adjust=False).mean()
-    df['MACD_Histogram'] = df['MACD'] - df['Signal_Line']
-    
-    # Calculate Bollinger Bands
-    df['SMA20'] = df['Close'].rolling(window=20).mean()
-    df['STD20'] = df['Close'].rolling(window=20).std()
-    df['Upper_Band'] = df['SMA20'] + (df['STD20'] * 2)
-    df['Lower_Band'] = df['SMA20'] - (df['STD20'] * 2)
+    # Reuse precomputed indicators when available
+    df = data if 'RSI' in data.columns else add_technical_indicators(data)
     
     # Create subplots: 3 rows, 1 column
     fig = go.Figure()